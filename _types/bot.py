@@ -514,8 +514,8 @@ class Bot(BotBase):
     async def _load_guild_prefixes(self) -> None:
         from models import Guild  # type: ignore
 
-        for config in await Guild.all():
-            self.guild_prefixes[config.id] = config.prefix
+        # Only the two columns are needed, so no model instance is built per row
+        self.guild_prefixes.update(await Guild.all().values_list("id", "prefix"))
         logger.debug("Loaded all guild prefixes")
 
     def update_guild_prefix(self, guild_id: int, prefix: str, /) -> None:
@@ -547,7 +547,8 @@ class Bot(BotBase):
         return await self.loop.run_in_executor(None, function, *args)
 
     async def close(self) -> None:
-        return await super().close()
+        await super().close()
+        await Tortoise.close_connections()
 
     async def load_extensions(self, iterable: Iterable[str], /) -> None:
         """Loads multiple extensions"""
@@ -24,6 +24,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Callable, List, Sequence, TypeVar
 
 from discord import app_commands
@@ -68,19 +69,29 @@ def can_run_warn() -> Check[GuildContext]:
     return commands.check(pred)
 
 
-def has_permissions(**perms: bool):
-    """Adds a ``app_commands.default_permissions`` and ``commands.has_permissions`` checls
-    at once.
-    """
+@lru_cache(maxsize=64)
+def _permissions_decorator(perms: frozenset[tuple[str, bool]]):
+    kwargs = dict(perms)
+    check = commands.has_permissions(**kwargs)
+    default_permissions = app_commands.default_permissions(**kwargs)
 
     def decorator(func):
-        commands.has_permissions(**perms)(func)
-        app_commands.default_permissions(**perms)(func)
+        check(func)
+        default_permissions(func)
         return func
 
     return decorator
 
 
+def has_permissions(**perms: bool):
+    """Adds a ``app_commands.default_permissions`` and ``commands.has_permissions`` checls
+    at once.
+
+    Commands sharing the same permissions share the same decorator.
+    """
+    return _permissions_decorator(frozenset(perms.items()))
+
+
 def find_all(predicate: Callable[[FI], bool], iterable: Sequence[FI]) -> List[FI]:
     """Iterates over ``iterable`` and returns all values that make ``predicate(value)`` return a truthy value.
 
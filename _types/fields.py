@@ -40,6 +40,7 @@ from tortoise.backends.asyncpg.client import AsyncpgDBClient
 
 T = TypeVar("T")
 TM = TypeVar("TM", bound="CompositePrimaryKeyTable")
+MT = TypeVar("MT", bound=Model)
 A = TypeVar("A")
 L = TypeVar("L", bound="Literal[A]")  # pyright: ignore
 
@@ -56,6 +57,8 @@ class WarnsDataField(Field[dict], WarnConfig):
         The custom JSON encoder.
     decoder: Callable[[Any], Any]
         The custom JSON decoder.
+    default: WarnConfig | Callable[[], WarnConfig]
+        The default value, or a factory that creates a new one for each row.
     """
 
     SQL_TYPE = "JSON"
@@ -74,10 +77,12 @@ class WarnsDataField(Field[dict], WarnConfig):
         self,
         encoder: JsonDumpsFunc = JSON_DUMPS,
         decoder: JsonLoadsFunc = JSON_LOADS,
-        default: WarnConfig | None = None,
+        default: WarnConfig | Callable[[], WarnConfig] | None = None,
         **kwargs: Any,
     ) -> None:
-        if default is not None:
+        if callable(default):
+            kwargs["default"] = default
+        elif default is not None:
             kwargs["default"] = default.to_dict()
         super().__init__(**kwargs)
 
@@ -279,12 +284,43 @@ def composite_primary_keys(*keys: str) -> Callable[[type[TM]], type[TM]]:
     return decorator
 
 
+_UPSERT_QUERIES: dict[type[CompositePrimaryKeyTable], tuple[str, tuple[str, ...]]] = {}
+
+
 class CompositePrimaryKeyTable(Model):
     """Represents a composite primary key table."""
 
     __composite_primary_keys__: list[str]
     __resolved_composite_primary_keys__: Mapping[str, Field]
 
+    @classmethod
+    def _get_upsert_query(cls) -> tuple[str, tuple[str, ...]]:
+        """Returns the upsert query of this table, along with the fields its values come from.
+
+        The columns of a table never change, so the query is only built once per table.
+        """
+        cached = _UPSERT_QUERIES.get(cls)
+        if cached is not None:
+            return cached
+
+        fields = tuple(cls._meta.fields_map)
+        pks = tuple(cls.__resolved_composite_primary_keys__)
+        update_fields = tuple(field for field in fields if field not in pks)
+
+        def safe(field: str) -> str:
+            return field if field not in RESERVED_DB_NAMES else f'"{field}"'
+
+        query = 'INSERT INTO "%s" (%s) VALUES (%s) ON CONFLICT (%s) DO UPDATE SET %s;' % (
+            cls._meta.db_table,
+            ", ".join(safe(field) for field in fields),
+            ", ".join(f"${pos}" for pos in range(1, len(fields) + 1)),
+            ", ".join(safe(field) for field in pks),
+            # EXCLUDED holds the row that was proposed for insertion, so every value is only sent once
+            ", ".join(f"{safe(field)}=EXCLUDED.{safe(field)}" for field in update_fields),
+        )
+        ret = _UPSERT_QUERIES[cls] = (query, fields)
+        return ret
+
     async def save(  # type: ignore
         self,
         using_db: AsyncpgDBClient | None = None,
@@ -323,62 +359,44 @@ class CompositePrimaryKeyTable(Model):
             created = False
         else:
             fields = self._meta.fields_map
-            s_pos = 1
-            s_pos_values: list[Any] = []
-            string = (
-                'INSERT INTO "%s" (%s) VALUES (%s) ON CONFLICT (%s) DO UPDATE SET %s;'
-            )
-            table_name = self._meta.db_table
-            safe_field_names = list(
-                field if field not in RESERVED_DB_NAMES else f'"{field}"'
-                for field in fields
-            )
-            insert_fields_string = ", ".join(safe_field_names)
-            safe_pks_names = list(
-                (
-                    field.model_field_name
-                    if field.model_field_name not in RESERVED_DB_NAMES
-                    else f'"{field.model_field_name}"'
-                )
-                for field in self.__resolved_composite_primary_keys__.values()
-            )
-            conflictive_pks = ", ".join(safe_pks_names)
-            insert_values_strings: list[str] = []
-            for field in safe_field_names:
-                value = getattr(self, field.replace('"', ""))
-                value_string = f"${s_pos}"
-                insert_values_strings.append(value_string)
-                s_pos += 1
-                s_pos_values.append(
-                    fields[field.replace('"', "")].to_db_value(value, self)
-                )
-            insert_values_string = ", ".join(insert_values_strings)
-            update_values_strings: list[str] = []
-            for field in safe_field_names:
-                if field in safe_pks_names:
-                    continue  # Ignore primary keys, they already exist if the DO UPDATE clause gets called
-
-                value = getattr(self, field.replace('"', ""))
-                value_string = f"{field}=${s_pos}"
-                update_values_strings.append((value_string))
-                s_pos += 1
-                s_pos_values.append(
-                    fields[field.replace('"', "")].to_db_value(value, self)
-                )
-            update_values_string = ", ".join(update_values_strings)
-            query = string % (
-                table_name,
-                insert_fields_string,
-                insert_values_string,
-                conflictive_pks,
-                update_values_string,
-            )
+            query, query_fields = self._get_upsert_query()
+            s_pos_values: list[Any] = [
+                fields[field].to_db_value(getattr(self, field), self)
+                for field in query_fields
+            ]
             await executor.db.execute_insert(query, s_pos_values)
             created = True
         self._saved_in_db = True
         await self._post_save(db, created, update_fields)
 
 
+async def ensure_row(table: type[MT], /, **keys: Any) -> MT:
+    """Same as ``table.get_or_create(**keys)`` but in a single round-trip.
+
+    ``keys`` must be the columns of a primary key or unique constraint of ``table``.
+    """
+    meta = table._meta
+    instance = table(**keys)
+
+    columns: list[str] = []
+    values: list[Any] = []
+    for name, column in meta.fields_db_projection.items():
+        columns.append(f'"{column}"')
+        values.append(
+            meta.fields_map[name].to_db_value(getattr(instance, name), instance)
+        )
+
+    conflict = [f'"{meta.fields_db_projection[name]}"' for name in keys]
+    placeholders = ", ".join(f"${pos}" for pos in range(1, len(values) + 1))
+    query = (
+        f'INSERT INTO "{meta.db_table}" ({", ".join(columns)}) VALUES ({placeholders}) '
+        f'ON CONFLICT ({", ".join(conflict)}) DO UPDATE SET {conflict[0]} = EXCLUDED.{conflict[0]} '
+        "RETURNING *;"
+    )
+    rows = await table._choose_db(True).execute_query_dict(query, values)
+    return table._init_from_db(**rows[0])
+
+
 class LiteralField(Generic[L], Field[L]):
     """Simple varchar with type-checking additions as Literal-like."""
 
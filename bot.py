@@ -25,6 +25,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import os
+import asyncio
 import logging
 
 from _types import Bot
@@ -102,14 +103,69 @@ os.environ["JISHAKU_NO_DM_TRACEBACK"] = "True"
 os.environ["JISHAKU_HIDE"] = "True"
 
 
-async def create_tables_for(guild: discord.Guild) -> None:
-    from models import Guild, SuggestionsConfig, VouchsConfig, WarnsConfig
-
-    tables = (Guild, SuggestionsConfig, VouchsConfig, WarnsConfig)
-    for table in tables:
-        if not await table.exists(id=guild.id):
-            await table.create(id=guild.id)
-    bot.logger.info("Ensured all guild related configs for %s", guild.id)
+class GuildInitBatcher:
+    """Coalesces guild config creation into a single bulk insert per table"""
+
+    __slots__ = (
+        "delay",
+        "retry_delay",
+        "_pending",
+        "_handle",
+        "_tasks",
+    )
+
+    def __init__(self, delay: float = 0.05, retry_delay: float = 30) -> None:
+        self.delay: float = delay
+        self.retry_delay: float = retry_delay
+        self._pending: set[int] = set()
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def enqueue(self, guild_id: int) -> None:
+        """Schedules the guild related configs of ``guild_id`` to be created"""
+        self._pending.add(guild_id)
+        if self._handle is None:
+            self._handle = asyncio.get_running_loop().call_later(
+                self.delay, self._schedule_flush
+            )
+
+    def _schedule_flush(self) -> None:
+        task = asyncio.create_task(self._flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self) -> None:
+        from models import Guild, SuggestionsConfig, VouchsConfig, WarnsConfig
+
+        guild_ids, self._pending, self._handle = self._pending, set(), None
+
+        try:
+            for table in (Guild, SuggestionsConfig, VouchsConfig, WarnsConfig):
+                await table.bulk_create(
+                    [table(id=guild_id) for guild_id in guild_ids],
+                    ignore_conflicts=True,
+                    batch_size=10000,
+                )
+        except Exception:
+            # Conflicts are ignored, so retrying the whole batch is safe
+            self._pending |= guild_ids
+            if self._handle is None:
+                self._handle = asyncio.get_running_loop().call_later(
+                    self.retry_delay, self._schedule_flush
+                )
+            bot.logger.exception(
+                "Could not ensure the guild related configs for %s guilds, "
+                "retrying in %s seconds",
+                len(guild_ids),
+                self.retry_delay,
+            )
+            return
+        bot.logger.info(
+            "Ensured all guild related configs for %s guilds", len(guild_ids)
+        )
+
+
+guild_init = GuildInitBatcher()
 
 
 @bot.event
@@ -126,12 +182,12 @@ async def on_guild_join(guild: discord.Guild) -> None:
     async for entry in guild.audit_logs(limit=2, action=discord.AuditLogAction.bot_add):
         if entry.user is not None:
             await entry.user.send(embed=bot.thanks_for_adding())
-    await create_tables_for(guild)
+    guild_init.enqueue(guild.id)
 
 
 @bot.event
 async def on_guild_available(guild: discord.Guild):
-    await create_tables_for(guild)
+    guild_init.enqueue(guild.id)
 
 
 async def runner():
@@ -145,6 +201,4 @@ async def runner():
 
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(runner())
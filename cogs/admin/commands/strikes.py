@@ -360,7 +360,7 @@ class StrikesCommands:
 
         cfg = await StrikeGuildStaff.get_or_none(user=staff.id, guild=ctx.guild.id)
 
-        if not cfg or not cfg.strikes or len(cfg.strikes.keys()) <= 0:
+        if not cfg or not cfg.strikes or len(cfg.strikes) <= 0:
             return await ctx.reply(
                 "Este staff no tiene strikes, aún...", delete_after=5, ephemeral=True
             )
@@ -411,7 +411,7 @@ class StrikesCommands:
         cfg = await StrikeGuildStaff.get_or_none(user=staff.id, guild=ctx.guild.id)
         strikes = cast(dict[str, dict[str, str | int]], cfg.strikes if cfg else {})
 
-        if not cfg or not strikes or len(strikes.keys()) <= 0:
+        if not cfg or not strikes or len(strikes) <= 0:
             return await ctx.reply(
                 (
                     "Este usuario no tiene strikes, aún..."
@@ -119,7 +119,7 @@ class WarnsCommands:
         else:
             cfg.warns.update(warn_data)  # type: ignore
 
-        content = f"Se ha añadido la advertencia `{warn_id}` a {member.mention}, quién ahora tiene {len(cfg.warns.keys())} advertencias"  # type: ignore
+        content = f"Se ha añadido la advertencia `{warn_id}` a {member.mention}, quién ahora tiene {len(cfg.warns)} advertencias"  # type: ignore
 
         await ctx.reply(content)
         await cfg.save()
@@ -151,7 +151,7 @@ class WarnsCommands:
         """Quita una advertencia de un miembro."""
         user = await GuildUser.get_or_none(guild=ctx.guild.id, user=member.id)
 
-        if not user or not user.warns or len(user.warns.keys()) == 0:
+        if not user or not user.warns or len(user.warns) == 0:
             return await ctx.reply(
                 "Este usuario no tiene advertencias", ephemeral=True, delete_after=5
             )
@@ -270,8 +270,10 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
 
         conn: asyncpg.Connection
         async with connection.acquire_connection() as conn:
+            # Migrations hold several statements, so they keep their transaction
+            # and are sent through the simple query protocol in a single round-trip
             async with conn.transaction():
-                await conn.fetchrow(query)
+                await conn.execute(query)
 
     @commands.command(name='migrate-db', hidden=True)
     async def migrate_db(self, ctx: Context, *, version: int) -> None:
@@ -36,6 +36,16 @@ if TYPE_CHECKING:
 
 __all__ = ("SuggestionView", "ReviewSuggestionView")
 
+_HAS_VOTED = (
+    'SELECT 1 FROM "suggestionmessage" WHERE "id" = $1 AND $2 = ANY("voted_users");'
+)
+_ADD_VOTER = (
+    'INSERT INTO "suggestionmessage" ("id", "voted_users") VALUES ($1, ARRAY[$2::bigint]) '
+    'ON CONFLICT ("id") DO UPDATE '
+    'SET "voted_users" = array_append("suggestionmessage"."voted_users", $2) '
+    'WHERE NOT $2 = ANY("suggestionmessage"."voted_users");'
+)
+
 
 class SuggestionView(ui.View):
     """Represents the view of a suggestion"""
@@ -44,15 +54,17 @@ class SuggestionView(ui.View):
         self.suggestions: Type[Suggestion] = suggestion_cls
         super().__init__(timeout=None)
 
-    async def get_config(self, itx: discord.Interaction, /) -> Suggestion:
-        """Gets the config of interaction X"""
-        config, _ = await Suggestion.get_or_create({"voted_users": []}, id=itx.message.id)  # type: ignore
-        return config
+    async def add_vote(self, itx: discord.Interaction, /) -> None:
+        """Adds the user of interaction X to the voted users, without loading the array"""
+        db = Suggestion._choose_db(True)
+        await db.execute_query(_ADD_VOTER, [itx.message.id, itx.user.id])  # type: ignore
 
     async def interaction_check(self, interaction: discord.Interaction, /) -> bool:
-        return (
-            interaction.user.id not in (await self.get_config(interaction)).voted_users
+        db = Suggestion._choose_db()
+        count, _ = await db.execute_query(
+            _HAS_VOTED, [interaction.message.id, interaction.user.id]  # type: ignore
         )
+        return count == 0
 
     def update_suggestion_embed(
         self, embed: discord.Embed, /, type: Optional[Literal["u", "n", "d"]]
@@ -112,9 +124,7 @@ class SuggestionView(ui.View):
         embed: discord.Embed = self.update_suggestion_embed(message.embeds[0], type="u")
         await interaction.response.edit_message(embed=embed)
 
-        config = await self.get_config(interaction)
-        config.voted_users.append(interaction.user.id)
-        await config.save()
+        await self.add_vote(interaction)
 
     @ui.button(
         custom_id="suggestions:null",
@@ -130,9 +140,7 @@ class SuggestionView(ui.View):
         embed: discord.Embed = self.update_suggestion_embed(message.embeds[0], type="n")
         await interaction.response.edit_message(embed=embed)
 
-        config = await self.get_config(interaction)
-        config.voted_users.append(interaction.user.id)
-        await config.save()
+        await self.add_vote(interaction)
 
     @ui.button(
         custom_id="suggestions:downvote",
@@ -150,9 +158,7 @@ class SuggestionView(ui.View):
         embed: discord.Embed = self.update_suggestion_embed(message.embeds[0], type="d")
         await interaction.response.edit_message(embed=embed)
 
-        config = await self.get_config(interaction)
-        config.voted_users.append(interaction.user.id)
-        await config.save()
+        await self.add_vote(interaction)
 
 
 class ReviewSuggestionView(ui.View):
@@ -162,7 +162,7 @@ class Tags(discord.ext.commands.GroupCog, name="tag"):
         if not config.tags:
             return await itx.followup.send("No tienes etiquetas", ephemeral=True)
 
-        if tag not in config.tags.keys():
+        if tag not in config.tags:
             return await itx.followup.send(
                 f"No tienes una etiqueta llamada `{tag}`", ephemeral=True
             )
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
 import discord
-import traceback
+import inspect
 from discord.ext import commands
-from discord.ext.commands import Paginator as CommandPaginator
 from discord.ext import menus
 
 if TYPE_CHECKING:
@@ -12,6 +11,17 @@ if TYPE_CHECKING:
     from ..._types.bot import Bot
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+_PAGE_KWARGS: Dict[type, Callable[[Any], Any]] = {
+    dict: _identity,
+    str: lambda value: {"content": value},
+    discord.Embed: lambda value: {"embeds": [value]},
+}
+
+
 class NumberedPageModal(discord.ui.Modal, title="Ir a la Página"):
     page = discord.ui.TextInput(
         label="Página", placeholder="Introduce un número", min_length=1
@@ -48,6 +58,12 @@ class SpacePages(discord.ui.View):
         self.message: Optional[discord.Message] = None
         self.current_page: int = 0
         self.compact: bool = compact
+        self._max_pages: Optional[int] = None
+        self._page_cache: Dict[int, Dict[str, Any]] = {}
+        self._format_is_coro: bool = inspect.iscoroutinefunction(source.format_page)
+        self._allowed_ids: frozenset[Optional[int]] = frozenset(
+            (ctx.bot.owner_id, ctx.author.id)
+        )
 
         self.clear_items()
         self.fill_items()
@@ -72,23 +88,38 @@ class SpacePages(discord.ui.View):
             self.add_item(self.stop_pages)
 
     async def _get_kwargs_from_page(self, page: int) -> Dict[str, Any]:
-        value: discord.Embed = await discord.utils.maybe_coroutine(
-            self.source.format_page, self, page
-        )
-
-        if isinstance(value, dict):
-            return value
-        elif isinstance(value, str):
-            return {"content": value}
-        elif isinstance(value, discord.Embed):
-            return {"embeds": [value]}
+        if self._format_is_coro:
+            value = await self.source.format_page(self, page)
         else:
-            return value
+            value = self.source.format_page(self, page)
+
+        to_kwargs = _PAGE_KWARGS.get(type(value))
+        if to_kwargs is None:
+            # Subclasses of the supported types miss the exact type lookup
+            to_kwargs = next(
+                (func for cls, func in _PAGE_KWARGS.items() if isinstance(value, cls)),
+                _identity,
+            )
+        return to_kwargs(value)
+
+    def _cache_page(self, page_no: int, kwargs: Dict[str, Any]) -> None:
+        # Sources usually reuse the same embed for every page, so a copy is stored
+        if "embeds" in kwargs:
+            kwargs = {**kwargs, "embeds": [embed.copy() for embed in kwargs["embeds"]]}
+
+        if len(self._page_cache) >= 8:
+            del self._page_cache[next(iter(self._page_cache))]
+        self._page_cache[page_no] = kwargs
 
     async def show_page(self, itx: discord.Interaction, page_no: int) -> None:
-        page = await self.source.get_page(page_no)
-        self.current_page = page_no
-        kwargs = await self._get_kwargs_from_page(page)
+        kwargs = self._page_cache.get(page_no)
+        if kwargs is None:
+            page = await self.source.get_page(page_no)
+            self.current_page = page_no
+            kwargs = await self._get_kwargs_from_page(page)
+            self._cache_page(page_no, kwargs)
+        else:
+            self.current_page = page_no
         self._update_labels(page_no)
 
         if kwargs:
@@ -100,8 +131,8 @@ class SpacePages(discord.ui.View):
 
     def _update_labels(self, page_number: int) -> None:
         self.go_to_first_page.disabled = page_number == 0
+        max_pages = self._max_pages
         if self.compact:
-            max_pages = self.source.get_max_pages()
             self.go_to_last_page.disabled = (
                 max_pages is None or (page_number + 1) >= max_pages
             )
@@ -118,7 +149,6 @@ class SpacePages(discord.ui.View):
         self.go_to_previous_page.disabled = False
         self.go_to_first_page.disabled = False
 
-        max_pages = self.source.get_max_pages()
         if max_pages is not None:
             self.go_to_last_page.disabled = (page_number + 1) >= max_pages
             if (page_number + 1) >= max_pages:
@@ -131,7 +161,7 @@ class SpacePages(discord.ui.View):
     async def show_checked_page(
         self, interaction: discord.Interaction, page_number: int
     ) -> None:
-        max_pages = self.source.get_max_pages()
+        max_pages = self._max_pages
         try:
             if max_pages is None:
                 # If it doesn't give maximum pages, it cannot be checked
@@ -143,10 +173,7 @@ class SpacePages(discord.ui.View):
             pass
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user and interaction.user.id in (
-            self.ctx.bot.owner_id,
-            self.ctx.author.id,
-        ):
+        if interaction.user and interaction.user.id in self._allowed_ids:
             return True
         await interaction.response.send_message(
             "¡Este menú no puede ser controlado por tí!", ephemeral=True
@@ -160,16 +187,18 @@ class SpacePages(discord.ui.View):
     async def on_error(
         self, interaction: discord.Interaction, error: Exception, item: discord.ui.Item
     ) -> None:
+        import traceback
+
+        # Keep the last part of the traceback so the message fits in the 2000 characters limit
+        trace = "".join(
+            traceback.format_exception(type(error), error, error.__traceback__)
+        )[-1800:]
+        content = f"Un error desconocido ha ocurrido, disculpas.\nInformación: ```py\n{trace}```"
+
         if interaction.response.is_done():
-            await interaction.followup.send(
-                f"Un error desconocido ha ocurrido, disculpas.\nInformación: {traceback.format_exception(type(error), error, error.__traceback__)}",
-                ephemeral=True,
-            )
+            await interaction.followup.send(content, ephemeral=True)
         else:
-            await interaction.response.send_message(
-                f"Un error desconocido ha ocurrido, disculpas.\nInformación: {traceback.format_exception(type(error), error, error.__traceback__)}",
-                ephemeral=True,
-            )
+            await interaction.response.send_message(content, ephemeral=True)
 
     async def start(
         self, *, content: Optional[str] = None, ephemeral: bool = False
@@ -182,6 +211,7 @@ class SpacePages(discord.ui.View):
             return
 
         await self.source._prepare_once()
+        self._max_pages = self.source.get_max_pages()
         page = await self.source.get_page(0)
         kwargs = await self._get_kwargs_from_page(page)
         if content:
@@ -223,7 +253,7 @@ class SpacePages(discord.ui.View):
     ):
         """go to the last page"""
         # The call here is safe because it's guarded by skip_if
-        await self.show_page(interaction, self.source.get_max_pages() - 1)  # type: ignore
+        await self.show_page(interaction, self._max_pages - 1)  # type: ignore
 
     @discord.ui.button(label="Ir a página...", style=discord.ButtonStyle.grey)
     async def numbered_page(
@@ -233,7 +263,7 @@ class SpacePages(discord.ui.View):
         if self.message is None:
             return
 
-        modal = NumberedPageModal(self.source.get_max_pages())
+        modal = NumberedPageModal(self._max_pages)
         await interaction.response.send_modal(modal)
         timed_out = await modal.wait()
 
@@ -246,14 +276,17 @@ class SpacePages(discord.ui.View):
             )
             return
 
-        value = str(modal.page.value)
-        if not value.isdigit():
+        try:
+            value = int(modal.page.value)
+        except ValueError:
+            value = 0
+
+        if value < 1:
             await modal.interaction.response.send_message(
-                f"Esperado número, no {value!r}", ephemeral=True
+                f"Esperado número, no {modal.page.value!r}", ephemeral=True
             )
             return
 
-        value = int(value)
         await self.show_checked_page(modal.interaction, value - 1)
         if not modal.interaction.response.is_done():
             error = modal.page.placeholder.replace("Enter", "Esperado")  # type: ignore # Can't be None
@@ -288,12 +321,16 @@ class FieldPageSource(menus.ListPageSource):
     async def format_page(  # type: ignore
         self, menu: SpacePages, entries: list[tuple[Any, Any]]
     ) -> discord.Embed:
-        self.embed.clear_fields()
         if self.clear_description:
             self.embed.description = None
 
-        for key, value in entries:
-            self.embed.add_field(name=key, value=value, inline=self.inline)
+        # Same payload Embed.add_field appends, built in a single pass instead
+        # of clearing the fields and adding them one by one.
+        inline = self.inline
+        self.embed._fields = [
+            {"inline": inline, "name": str(key), "value": str(value)}
+            for key, value in entries
+        ]
 
         maximum = self.get_max_pages()
         if maximum > 1:
@@ -305,11 +342,38 @@ class FieldPageSource(menus.ListPageSource):
 
 class TextPageSource(menus.ListPageSource):
     def __init__(self, text, *, prefix="```", suffix="```", max_size=2000):
-        pages = CommandPaginator(prefix=prefix, suffix=suffix, max_size=max_size - 200)
+        # Builds the same pages as commands.Paginator in a single pass,
+        # except that overlong lines are split instead of raising
+        head: list[str] = [] if prefix is None else [prefix]
+        head_size = 0 if prefix is None else len(prefix) + 1
+        tail: list[str] = [] if suffix is None else [suffix]
+        limit = max_size - 200 - (len(suffix) if suffix else 0)
+
+        # Lines that do not fit in a page on their own are split across pages
+        room = limit - head_size - 1
+        if room <= 0:
+            raise ValueError("max_size is too small to fit any text")
+
+        pages: list[str] = []
+        current = head.copy()
+        size = head_size
         for line in text.split("\n"):
-            pages.add_line(line)
-
-        super().__init__(entries=pages.pages, per_page=1)
+            for start in range(0, max(len(line), 1), room):
+                chunk = line[start : start + room]
+                if len(current) > len(head) and size + len(chunk) + 1 > limit:
+                    # Pages made only of blank lines would be sent as empty messages
+                    if any(current[len(head) :]):
+                        pages.append("\n".join(current + tail))
+                    current = head.copy()
+                    size = head_size
+                current.append(chunk)
+                size += len(chunk) + 1
+
+        # SpacePages always shows the first page, so blank text still gets one
+        if any(current[len(head) :]) or not pages:
+            pages.append("\n".join(current + tail))
+
+        super().__init__(entries=pages, per_page=1)
 
     async def format_page(self, menu, content):  # type: ignore
         maximum = self.get_max_pages()
@@ -320,16 +384,17 @@ class TextPageSource(menus.ListPageSource):
 
 class SimplePageSource(menus.ListPageSource):
     async def format_page(self, menu, entries):  # type: ignore
-        pages = []
-        for index, entry in enumerate(entries, start=menu.current_page * self.per_page):
-            pages.append(f"{index + 1}. {entry}")
-
         maximum = self.get_max_pages()
         if maximum > 1:
             footer = f"Pág. {menu.current_page + 1}/{maximum} ({len(self.entries)} resultados)"
             menu.embed.set_footer(text=footer)
 
-        menu.embed.description = "\n".join(pages)
+        menu.embed.description = "\n".join(
+            f"{index}. {entry}"
+            for index, entry in enumerate(
+                entries, start=menu.current_page * self.per_page + 1
+            )
+        )
         return menu.embed
 
 
@@ -145,9 +145,14 @@ class Vouchs(commands.Cog):
 
         log.info("Started sanity vouch check")
 
+        gcfgs = {
+            gcfg.id: gcfg
+            for gcfg in await Guild.filter(id__in=[g.id for g in self.bot.guilds])
+        }
+
         for guild in self.bot.guilds:
             log.debug("Searching in guild %s", guild.name)
-            gcfg = await Guild.get_or_none(id=guild.id)
+            gcfg = gcfgs.get(guild.id)
             if not gcfg or not gcfg.alter:
                 log.debug(
                     "Skipping %s because it doesn't have any config or alter role set up",
@@ -155,14 +160,17 @@ class Vouchs(commands.Cog):
                 )
                 continue
 
-            configs = await VouchGuildUser.filter(guild=guild.id).all()
+            configs = {
+                config.user: config
+                for config in await VouchGuildUser.filter(guild=guild.id)
+            }
 
             if not configs:
                 log.debug("Skipping %s because it doesn't have any alters", guild.name)
                 continue
 
             for member in guild.members:
-                config = discord.utils.get(configs, user=member.id)
+                config = configs.get(member.id)
                 if not config:
                     log.debug("Skipping %s | Didn't have a config", str(member))
                     continue
@@ -478,21 +486,14 @@ class Vouchs(commands.Cog):
             La entidad al que reiniciar los vouchs, dejar en blanco para resetear a @everyone
         """
 
+        configs = VouchGuildUser.filter(guild=ctx.guild.id)
         if entity is not None:
-            config = await VouchGuildUser.get_or_none(
-                user=entity.id, guild=ctx.guild.id
-            )
+            configs = configs.filter(user=entity.id)
 
-            if not config:
-                configs = []
-            else:
-                configs = [
-                    config,
-                ]
-        else:
-            configs = await VouchGuildUser.filter(guild=ctx.guild.id).all()
+        # A single UPDATE resets every matching row at once
+        updated = await configs.update(recent=[], vouchs=0)
 
-        if configs is None or len(configs) == 0:
+        if not updated:
             if ctx.interaction:
                 return await ctx.interaction.response.send_message(
                     "No se pueden resetear los vouchs, por favor, comprueba que hay mínimo 1 usuario con mínimo 1 vouch en el servidor..",
@@ -500,19 +501,7 @@ class Vouchs(commands.Cog):
                 )
             return await ctx.message.add_reaction("\N{CROSS MARK}")
 
-        approximate_time = len(configs) + len(configs) * 0.5
-
-        ret = await ctx.reply(
-            f"{self.LOADING} | Reseteando los vouchs... Tiempo estimado: {approximate_time:.2f} segundos"
-        )
-
-        for config in configs:
-            config.recent = []
-            config.vouchs = 0
-            await config.save()
-            await asyncio.sleep(0.5)
-
-        await ret.edit(content=f"{self.TICK} | Proceso terminado exitósamente")
+        await ctx.reply(f"{self.TICK} | Proceso terminado exitósamente")
 
     @command()
     @commands.cooldown(1, 5, commands.BucketType.member)
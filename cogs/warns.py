@@ -24,10 +24,11 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any, Optional, Literal, overload
+from collections.abc import Callable, Coroutine, Sequence
+from typing import TYPE_CHECKING, Any, Optional
 
 import warnings
 import discord
@@ -36,8 +37,10 @@ from discord.ext import commands
 from discord_tools.app_commands import CogContextMenuHolder
 
 from _types.bot import Bot
+from _types.fields import ensure_row
 from _types.warns import Warn, ActionType
 from models import GuildUser, WarnsConfig
+from sessions.config import get_config
 
 if TYPE_CHECKING:
     from _types.warns.protocols import Object
@@ -48,6 +51,8 @@ _log = logging.getLogger(__name__)
 class MockMessageable:
     """Mock messageable that represents a missing channel"""
 
+    __slots__ = ()
+
     @discord.utils.copy_doc(discord.abc.Messageable.send)
     async def send(
         self, content: Optional[str] = discord.utils.MISSING, **kwargs: Any
@@ -58,16 +63,42 @@ class MockMessageable:
         return discord.ChannelType.text
 
 
-class MissingAsset:
-    """Mock asset"""
+_MOCK_MESSAGEABLE = MockMessageable()
 
-    @property
-    def url(self) -> None:
-        """:class:`str`: Returns the underlying URL of the asset."""
-        return None
+_ACTION_STRINGS: dict[ActionType, Callable[..., str]] = {
+    ActionType.kick: lambda: "El miembro fue expulsado",
+    ActionType.ban: lambda: "El miembro fue baneado",
+    ActionType.timeout: lambda *, duration: (
+        "El miembro fue aislado temporalmente hasta "
+        f'{discord.utils.format_dt(datetime.datetime.now(datetime.UTC) + duration, style="R")}'
+    ),
+    ActionType.role: lambda *, roles: (
+        "Se le añadieron los roles: "
+        f'{discord.utils._human_join([f"<@&{role.id}>" for role in roles], final="y")}'
+    ),
+}
+
+_FAILED_ACTION_STRINGS: dict[ActionType, str] = {
+    ActionType.kick: "No se pudo expulsar al miembro",
+    ActionType.ban: "No se pudo banear al miembro",
+    ActionType.timeout: "No se pudo aislar temporalmente al miembro",
+    ActionType.role: "No se pudieron añadir los roles al miembro",
+}
+
+
+def _display_avatar_url(obj: Object) -> Optional[str]:
+    """Returns the display avatar URL of ``obj``, or ``None`` if it has no avatar"""
+    avatar = getattr(obj, "display_avatar", None)
+    return avatar.url if avatar is not None else None
 
 
 class MockMember:
+    __slots__ = (
+        "guild_id",
+        "id",
+        "state",
+    )
+
     def __init__(self, guild_id: int, user_id: int, state: ConnectionState) -> None:
         self.guild_id: int = guild_id
         self.id: int = user_id
@@ -88,11 +119,11 @@ class MockMember:
                 **{"roles": tuple(r.id for r in roles)},
             )
         else:
+            role_ids = tuple(r.id for r in roles)
             req = self.state.http.add_role
-            guild_id = self.guild_id
-            user_id = self.id
-            for role in roles:
-                await req(guild_id, user_id, role.id, reason=reason)
+            guild_id, user_id = self.guild_id, self.id
+            for role_id in role_ids:
+                await req(guild_id, user_id, role_id, reason=reason)
 
     @discord.utils.copy_doc(discord.Member.remove_roles)
     async def remove_roles(
@@ -102,10 +133,11 @@ class MockMember:
         atomic: bool = True,
     ) -> None:
         # We ignore atomic as we cannot access the previous member state roles
-        for role in roles:
-            await self.state.http.remove_role(
-                self.guild_id, self.id, role.id, reason=reason
-            )
+        role_ids = tuple(r.id for r in roles)
+        req = self.state.http.remove_role
+        guild_id, user_id = self.guild_id, self.id
+        for role_id in role_ids:
+            await req(guild_id, user_id, role_id, reason=reason)
 
     @discord.utils.copy_doc(discord.Member.timeout)
     async def timeout(
@@ -169,7 +201,7 @@ class MockMember:
 
     @discord.utils.copy_doc(discord.Member.kick)
     async def kick(self, *, reason: str | None = None) -> None:
-        await self.state.http.unban(
+        await self.state.http.kick(
             self.id,
             self.guild_id,
             reason=reason,
@@ -182,6 +214,7 @@ class Warns(commands.Cog):
     def __init__(self, bot: Bot) -> None:
         self.bot: Bot = bot
         self._context_menu_holder: CogContextMenuHolder = CogContextMenuHolder(self)
+        self._default_color: discord.Color = bot.default_color
 
     async def cog_load(self) -> None:
         self._context_menu_holder.load_menus()
@@ -192,82 +225,37 @@ class Warns(commands.Cog):
             self.bot.tree.remove_command(command.name, type=command.type)
             self._context_menu_holder.remove_menu(command.name)
 
-    @overload
-    def _log_embed(
-        self,
-        action: Literal[ActionType.ban],
-        data: Warn,
-        warns: int,
-    ) -> discord.Embed: ...
-
-    @overload
-    def _log_embed(
-        self,
-        action: Literal[ActionType.kick],
-        data: Warn,
-        warns: int,
-    ) -> discord.Embed: ...
-
-    @overload
-    def _log_embed(
-        self,
-        action: Literal[ActionType.timeout],
-        data: Warn,
-        warns: int,
-        *,
-        duration: datetime.timedelta,
-    ) -> discord.Embed: ...
-
-    @overload
-    def _log_embed(
-        self,
-        action: Literal[ActionType.role],
-        data: Warn,
-        warns: int,
-        *,
-        roles: Sequence[Object],
-    ) -> discord.Embed: ...
-
-    @overload
-    def _log_embed(
-        self,
-        action: None,
-        data: Warn,
-        warns: int,
-    ) -> discord.Embed: ...
+    async def _get_config(self, guild_id: int) -> WarnsConfig:
+        return await get_config(WarnsConfig, guild_id)
 
     def _log_embed(
         self,
-        action: Optional[ActionType],
+        actions: Sequence[tuple[ActionType, dict[str, Any]]],
+        failed: Sequence[tuple[ActionType, dict[str, Any]]],
         data: Warn,
         warns: int,
-        *,
-        roles: Sequence[Object] = discord.utils.MISSING,
-        duration: datetime.timedelta = discord.utils.MISSING,
     ) -> discord.Embed:
-        embed = discord.Embed(color=self.bot.default_color)
-        embed.set_thumbnail(
-            url=getattr(data.target, "display_avatar", MissingAsset()).url
-        )
+        target_url = _display_avatar_url(data.target)
+        staff_url = _display_avatar_url(data.staff)
+
+        embed = discord.Embed(color=self._default_color)
+        embed.set_thumbnail(url=target_url)
         embed.set_author(
             name=f"Staff responsable:",
-            icon_url=getattr(data.staff, "display_avatar", MissingAsset()).url,
+            icon_url=staff_url,
         )
         embed.description = f"<@{data.staff.id}>\n\nEl usuario <@{data.target.id}> ({data.target.id}) ha alcanzado {warns} warn(s)."
 
-        if action is not None:
-            if action == ActionType.kick:
-                string = "El miembro fue expulsado"
-            elif action == ActionType.ban:
-                string = "El miembro fue baneado"
-            elif action == ActionType.timeout:
-                string = f'El miembro fue aislado temporalmente hasta {discord.utils.format_dt(datetime.datetime.now(datetime.UTC)+duration, style="R")}'
-            elif action == ActionType.role:
-                string = f'Se le añadieron los roles: {discord.utils._human_join([f"<@&{role.id}>" for role in roles], final="y")}'
-
+        for action, kwargs in actions:
             embed.add_field(
                 name="Acción tomada:",
-                value=string,
+                value=_ACTION_STRINGS[action](**kwargs),
+            )
+
+        for action, _ in failed:
+            embed.add_field(
+                name="Acción fallida:",
+                value=_FAILED_ACTION_STRINGS[action],
             )
 
         return embed
@@ -278,91 +266,88 @@ class Warns(commands.Cog):
         data: Warn,
     ) -> Any:
         """Called when a warn is added"""
-        user_data, _ = await GuildUser.get_or_create(
-            user=data.target.id, guild=data.guild.id
+        user_data, config = await asyncio.gather(
+            ensure_row(GuildUser, guild=data.guild.id, user=data.target.id),
+            self._get_config(data.guild.id),
         )
-        config, _ = await WarnsConfig.get_or_create(id=data.guild.id)
-
-        warn_amount = len(user_data.warns.keys())
-        if config.notifications is not None:
-            guild = self.bot.get_guild(data.guild.id)
-            if guild:
-                log_channel = (
-                    guild.get_channel(config.notifications) or MockMessageable()
-                )
-                if isinstance(
-                    log_channel, (discord.ForumChannel, discord.CategoryChannel)
-                ):
-                    log_channel = MockMessageable()
-            else:
-                log_channel = MockMessageable()
-        else:
-            log_channel = MockMessageable()
 
+        warn_amount = len(user_data.warns)
         roles, timeouts, kicks, bans = config.config.get_punishments(warn_amount)
 
-        if isinstance(data.target, discord.Object):
-            data.target = MockMember(
-                data.guild.id, data.target.id, self.bot._connection
-            )
-
-        try:
-            assert isinstance(data.target, discord.Member)
-        except AssertionError:
+        if not (roles or timeouts or kicks or bans) and config.notifications is None:
             return
 
-        if bans:
-            ban = bans[0]
-
-            await data.target.ban(reason=f"Ha llegado a {ban.n} warns")
-            await log_channel.send(
-                embed=self._log_embed(ActionType.ban, data, warn_amount)
+        if config.notifications is not None:
+            log_channel = self.bot.get_partial_messageable(
+                config.notifications,
+                guild_id=data.guild.id,
             )
-            return
-
-        if kicks:
-            kick = kicks[0]
-            await data.target.kick(reason=f"Ha llegado a {kick.n} warns")
-            await log_channel.send(
-                embed=self._log_embed(ActionType.kick, data, warn_amount)
-            )  # type: ignore
-            return
-
-        sent = False
+        else:
+            log_channel = _MOCK_MESSAGEABLE
 
-        if timeouts:
-            timeout = timeouts[0]
+        target: discord.Member | MockMember
+        if isinstance(data.target, discord.Member):
+            target = data.target
+        else:
+            # The member is not cached, so instead of fetching it we act on
+            # it through the raw HTTP routes.
+            target = MockMember(data.guild.id, data.target.id, self.bot._connection)
 
-            await data.target.timeout(
-                timeout.duration, reason=f"Ha alcanzado {timeout.n} warns"
-            )
-            await log_channel.send(
-                embed=self._log_embed(ActionType.timeout, data, warn_amount, duration=timeout.duration)  # type: ignore
-            )
-            sent = True
+        actions: list[tuple[ActionType, dict[str, Any]]] = []
+        requests: list[Coroutine[Any, Any, None]] = []
 
-        if roles:
-            to_add: list[Object] = [role.role for role in roles]  # type: ignore
-            await data.target.add_roles(
-                *to_add, reason=f"Ha alcanzado {warn_amount} warns"
-            )
-            await log_channel.send(
-                embed=self._log_embed(ActionType.role, data, warn_amount, roles=to_add)
-            )  # type: ignore
-            sent = True
+        if bans:
+            ban = bans[0]
+            requests.append(target.ban(reason=f"Ha llegado a {ban.n} warns"))
+            actions.append((ActionType.ban, {}))
+        elif kicks:
+            kick = kicks[0]
+            requests.append(target.kick(reason=f"Ha llegado a {kick.n} warns"))
+            actions.append((ActionType.kick, {}))
+        else:
+            if timeouts:
+                timeout = timeouts[0]
+                requests.append(
+                    target.timeout(
+                        timeout.duration, reason=f"Ha alcanzado {timeout.n} warns"
+                    )
+                )
+                actions.append((ActionType.timeout, {"duration": timeout.duration}))
+
+            if roles:
+                to_add: list[Object] = [role.role for role in roles]  # type: ignore
+                requests.append(
+                    target.add_roles(
+                        *to_add, reason=f"Ha alcanzado {warn_amount} warns"
+                    )
+                )
+                actions.append((ActionType.role, {"roles": to_add}))
+
+        # The punishments run concurrently, and the log only reports the ones that succeeded
+        results = await asyncio.gather(*requests, return_exceptions=True)
+
+        done: list[tuple[ActionType, dict[str, Any]]] = []
+        failed: list[tuple[ActionType, dict[str, Any]]] = []
+        for action, result in zip(actions, results):
+            if isinstance(result, BaseException):
+                _log.warning(
+                    "Could not apply %s to %s in guild %s",
+                    action[0].name,
+                    data.target.id,
+                    data.guild.id,
+                    exc_info=result,
+                )
+                failed.append(action)
+            else:
+                done.append(action)
 
-        if not sent:
-            await log_channel.send(
-                embed=self._log_embed(None, data, warn_amount)
-            )  # type: ignore
+        await log_channel.send(embed=self._log_embed(done, failed, data, warn_amount))
 
     @commands.Cog.listener()
     async def on_warn_remove(self, remover: discord.User, data: Warn) -> Any:
         """Called when a warn is removed"""
 
-        config, _ = await WarnsConfig.get_or_create(
-            id=data.guild.id,
-        )
+        config = await self._get_config(data.guild.id)
 
         if config.notifications is not None:
             partial = self.bot.get_partial_messageable(
@@ -370,7 +355,7 @@ class Warns(commands.Cog):
                 guild_id=data.guild.id,
             )
         else:
-            partial = MockMessageable()
+            partial = _MOCK_MESSAGEABLE
 
         await partial.send(embed=self.warn_removed_embed(remover, data))
 
@@ -380,7 +365,7 @@ class Warns(commands.Cog):
         reason = data.reason
         relative_created_at = discord.utils.format_dt(data.created_at, "R")
         absolute_created_at = discord.utils.format_dt(data.created_at, "f")
-        embed = discord.Embed(colour=self.bot.default_color)
+        embed = discord.Embed(colour=self._default_color)
         embed.title = "Advertencia Eliminada"
         embed.description = (
             f"**Objetivo de la advertencia:** {user_mention} ({data.target.id})\n"
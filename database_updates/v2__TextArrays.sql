@@ -0,0 +1,5 @@
+-- This update makes the string array columns text arrays, as char arrays only store one character per element
+
+-- model: VouchGuildUser
+alter table vouchguilduser alter column recent type text[] using recent::text[];
+alter table vouchguilduser alter column recent set default array[]::text[];
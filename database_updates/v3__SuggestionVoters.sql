@@ -0,0 +1,5 @@
+-- This update makes the suggestion voters a bigint array, as user IDs do not fit in an int
+
+-- model: Suggestion
+alter table suggestionmessage alter column voted_users type bigint[] using voted_users::bigint[];
+alter table suggestionmessage alter column voted_users set default array[]::bigint[];
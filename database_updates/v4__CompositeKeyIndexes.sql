@@ -0,0 +1,18 @@
+-- This update adds the unique indexes backing the composite primary keys, as the tables were created without any.
+-- Duplicated rows are removed first (keeping the oldest one), as the indexes could not be created otherwise
+
+-- model: GuildUser
+delete from guilduser a using guilduser b where a.guild = b.guild and a."user" = b."user" and a.ctid > b.ctid;
+create unique index if not exists guilduser_guild_user_idx on guilduser (guild, "user");
+
+-- model: VouchGuildUser
+delete from vouchguilduser a using vouchguilduser b where a.guild = b.guild and a."user" = b."user" and a.ctid > b.ctid;
+create unique index if not exists vouchguilduser_guild_user_idx on vouchguilduser (guild, "user");
+
+-- model: GuildApplication
+delete from guildapplication a using guildapplication b where a.guild = b.guild and a.name = b.name and a.ctid > b.ctid;
+create unique index if not exists guildapplication_guild_name_idx on guildapplication (guild, name);
+
+-- model: StrikeGuildStaff
+delete from strikeguildstaff a using strikeguildstaff b where a.guild = b.guild and a."user" = b."user" and a.ctid > b.ctid;
+create unique index if not exists strikeguildstaff_guild_user_idx on strikeguildstaff (guild, "user");
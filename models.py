@@ -47,7 +47,7 @@ from tortoise.fields import (
 from tortoise.contrib.postgres.fields import ArrayField as Array
 
 BigIntArray: partial[Field[list[int]]] = partial(Array, 'bigint')
-VarcharArray: partial[Field[list[str]]] = partial(Array, 'char')
+VarcharArray: partial[Field[list[str]]] = partial(Array, 'text')
 JSONBArray: partial[Field[dict[str, Any] | list[Any]]] = partial(Array, 'jsonb')
 
 __all__ = (
@@ -103,6 +103,7 @@ class GuildUser(CompositePrimaryKeyTable):
 
     class Meta:  # type: ignore
         table = "guilduser"
+        unique_together = (("guild", "user"),)
 
 
 # VouchsConfig Table
@@ -127,6 +128,7 @@ class VouchGuildUser(CompositePrimaryKeyTable):
 
     class Meta:  # type: ignore
         table = "vouchguilduser"
+        unique_together = (("guild", "user"),)
 
 
 # WarnsConfig Table
@@ -135,7 +137,7 @@ class WarnsConfig(Table):
         primary_key=True,
     )
     enabled = Boolean(default=False)
-    config: Field[WarnConfig] = WarnsDataField(default=WarnConfig.empty())  # type: ignore
+    config: Field[WarnConfig] = WarnsDataField(default=WarnConfig.empty)  # type: ignore
     notifications = BigInt(null=True)
 
     class Meta:  # type: ignore
@@ -152,6 +154,7 @@ class GuildApplication(CompositePrimaryKeyTable):
 
     class Meta:  # type: ignore
         table = "guildapplication"
+        unique_together = (("guild", "name"),)
 
 
 # StrikeGuildStaff Table
@@ -164,6 +167,7 @@ class StrikeGuildStaff(CompositePrimaryKeyTable):
 
     class Meta:  # type: ignore
         table = "strikeguildstaff"
+        unique_together = (("guild", "user"),)
 
 
 # UserTagsPrivate Table
@@ -205,7 +209,7 @@ class SuggestionsConfig(Table):
 # Suggestion Table
 class Suggestion(Table):
     id = BigInt(primary_key=True)
-    voted_users = Array(default=[])
+    voted_users = BigIntArray(default=[])
 
     class Meta:  # type: ignore
         table = "suggestionmessage"
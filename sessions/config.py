@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from typing import Optional, Protocol, TYPE_CHECKING
+import asyncio
+import copy
+import time
+from typing import Any, Protocol, TypeVar, TYPE_CHECKING
 
 import discord
 from discord.member import Member
 from discord.ui.view import View
+from tortoise import Model
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.signals import post_delete, post_save
 
 from _types.context import GuildContext as Context
+from _types.fields import ensure_row
 from _types.views import ConfigView, StrikesView, WarnsView
 from _types.embeds import AlterRole, StrikesEmbed, WarnsEmbed
-from _types.warns import WarnConfig as WarnConfigModel
 from models import (
     Guild,
     VouchsConfig,
@@ -22,6 +28,55 @@ if TYPE_CHECKING:
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
 
+TableT = TypeVar("TableT", bound=Model)
+
+
+_CACHED_TABLES: tuple[type[Model], ...] = (Guild, VouchsConfig, WarnsConfig)
+_CONFIG_TTL = 60
+# (table, guild id) -> (row, time.monotonic() when it was cached)
+_config_cache: dict[tuple[type[Model], int], tuple[Model, float]] = {}
+
+
+async def get_config(table: type[TableT], guild_id: int) -> TableT:
+    """Returns the config row of a guild, cached for 60 seconds and refreshed on every save.
+
+    Each call returns its own copy, so changes that are never saved do not leak into the cache.
+    """
+    key = (table, guild_id)
+    try:
+        config, cached_at = _config_cache[key]
+    except KeyError:
+        pass
+    else:
+        if time.monotonic() - cached_at < _CONFIG_TTL:
+            return copy.deepcopy(config)  # type: ignore
+
+    config = await ensure_row(table, id=guild_id)
+    _config_cache[key] = (copy.deepcopy(config), time.monotonic())
+    return config
+
+
+@post_save(*_CACHED_TABLES)
+async def _on_config_save(
+    sender: type[Model],
+    instance: Model,
+    created: bool,
+    using_db: BaseDBAsyncClient | None,
+    update_fields: list[str],
+) -> None:
+    # Any write of these tables replaces the cached row, so the sessions never
+    # see (and save back) stale data.
+    _config_cache[(sender, instance.pk)] = (copy.deepcopy(instance), time.monotonic())
+
+
+@post_delete(*_CACHED_TABLES)
+async def _on_config_delete(
+    sender: type[Model],
+    instance: Model,
+    using_db: BaseDBAsyncClient | None,
+) -> None:
+    _config_cache.pop((sender, instance.pk), None)
+
 
 class SessionProto(Protocol):
     if TYPE_CHECKING:
@@ -37,6 +92,13 @@ class SessionProto(Protocol):
 
 
 class ConfigSession:
+    __slots__ = (
+        "invoker",
+        "config",
+        "vouch_cfg",
+        "_context",
+    )
+
     def __init__(self, invoker: Member, config: Guild, vouch_cfg: VouchsConfig) -> None:
         self.invoker: Member = invoker
         self.config: Guild = config
@@ -56,8 +118,10 @@ class ConfigSession:
 
     @classmethod
     async def from_context(cls, ctx: Context) -> ConfigSession:
-        cfg, _ = await Guild.get_or_create(id=ctx.guild.id)
-        vouch, _ = await VouchsConfig.get_or_create(id=ctx.guild.id)
+        cfg, vouch = await asyncio.gather(
+            get_config(Guild, ctx.guild.id),
+            get_config(VouchsConfig, ctx.guild.id),
+        )
         instance = cls(ctx.author, cfg, vouch)
         instance.context = ctx
 
@@ -73,6 +137,12 @@ class ConfigSession:
 
 
 class StrikesConfigSession:
+    __slots__ = (
+        "invoker",
+        "config",
+        "_context",
+    )
+
     def __init__(self, invoker: Member, config: Guild) -> None:
         self.invoker: Member = invoker
         self.config: Guild = config
@@ -89,11 +159,7 @@ class StrikesConfigSession:
 
     @classmethod
     async def from_context(cls, ctx: Context) -> StrikesConfigSession:
-        cfg: Optional[Guild] = await Guild.filter(id=ctx.guild.id).get_or_none()
-
-        if not cfg:
-            cfg = await Guild.create(id=ctx.guild.id, enabled=True, prefix="!")
-
+        cfg = await get_config(Guild, ctx.guild.id)
         instance = cls(ctx.author, cfg)
         instance.context = ctx
 
@@ -112,6 +178,13 @@ class StrikesConfigSession:
 
 
 class WarnsConfigSession:
+    __slots__ = (
+        "invoker",
+        "config",
+        "_context",
+        "model",
+    )
+
     def __init__(self, invoker: Member, config: WarnsConfig) -> None:
         self.invoker: Member = invoker
         self.config: WarnsConfig = config
@@ -130,22 +203,7 @@ class WarnsConfigSession:
 
     @classmethod
     async def from_context(cls, ctx: Context) -> WarnsConfigSession:
-        cfg: WarnsConfig | None = await WarnsConfig.get_or_none(
-            id=ctx.guild.id,
-        )
-
-        if not cfg:
-            cfg = await WarnsConfig.create(
-                id=ctx.guild.id,
-                enabled=False,
-                config=WarnConfigModel.from_params(
-                    roles=[],
-                    bans=[],
-                    kicks=[],
-                    timeouts=[],
-                    metadata=None,
-                ),
-            )
+        cfg = await get_config(WarnsConfig, ctx.guild.id)
         instance = cls(ctx.author, cfg)
         instance.context = ctx
 
@@ -19,23 +19,58 @@ class Cell:
     enemy_state: Optional[bool]
     bomb_state: Optional[bool]
     button: Optional[Button] = None
+    # Only changes along with emoji or enemy_state, so it is stored instead of computed
+    display_emoji: Optional[str] = None
 
     @property
     def ship(self) -> bool:
         return self.emoji is not None
 
-    @classmethod
-    def empty(cls) -> Cell:
-        return cls(emoji=None, enemy_state=None, bomb_state=None)
-
-    @property
-    def display_emoji(self) -> Optional[str]:
+    def set_ship(self, emoji: str) -> None:
+        self.emoji = emoji
         if self.enemy_state is None:
-            return self.emoji
-
-        if self.enemy_state:
-            return "💣"
-        return "🌀"
+            self.display_emoji = emoji
+
+    def set_enemy(self, hit: bool) -> None:
+        self.enemy_state = hit
+        self.display_emoji = "💣" if hit else "🌀"
+
+
+async def _response_message(
+    itx: discord.Interaction, response: Optional[discord.InteractionCallbackResponse]
+) -> discord.InteractionMessage:
+    """Returns the message of an interaction response, only fetching it if Discord did not include it"""
+    if response is not None and isinstance(
+        response.resource, discord.InteractionMessage
+    ):
+        return response.resource
+    return await itx.original_response()
+
+
+def _bit(x: int, y: int) -> int:
+    """Returns the bit of the cell at (x, y) in a 25 bit board"""
+    return 1 << (x + y * 5)
+
+
+# Footprint bitmask of every ship that fits on the board, keyed by (x, y, dx, dy, size)
+_FOOTPRINTS: dict[tuple[int, int, int, int, int], int] = {
+    (x, y, dx, dy, size): sum(_bit(x + dx * i, y + dy * i) for i in range(size))
+    for dx, dy in ((1, 0), (0, 1))
+    for size in (2, 3, 4)
+    for x in range(5 - dx * (size - 1))
+    for y in range(5 - dy * (size - 1))
+}
+
+# Start positions that fit on the board, keyed by (dx, dy, size)
+_STARTS: dict[tuple[int, int, int], tuple[tuple[int, int], ...]] = {
+    (dx, dy, size): tuple(
+        (x, y)
+        for x in range(5 - dx * (size - 1))
+        for y in range(5 - dy * (size - 1))
+    )
+    for dx, dy in ((1, 0), (0, 1))
+    for size in (2, 3, 4)
+}
 
 
 class PlayerState:
@@ -44,17 +79,27 @@ class PlayerState:
         self.view: Optional[BoardView] = None
         self.ready: bool = False
         self.current_player: bool = False
-        empty = Cell.empty
         self.board: list[list[Cell]] = [
-            [empty(), empty(), empty(), empty(), empty()],
-            [empty(), empty(), empty(), empty(), empty()],
-            [empty(), empty(), empty(), empty(), empty()],
-            [empty(), empty(), empty(), empty(), empty()],
-            [empty(), empty(), empty(), empty(), empty()],
+            [Cell(None, None, None) for _ in range(5)] for _ in range(5)
         ]
 
+        # Bitboards of the cells holding a ship and the ship cells the enemy hit,
+        # the board above is only used to render the buttons
+        self.ships: int = 0
+        self.hits: int = 0
+        self.ship_masks: dict[str, int] = {}
+
         # self.generate_board()
 
+    def place_ship(self, x: int, y: int, emoji: str) -> None:
+        bit = _bit(x, y)
+        self.board[y][x].set_ship(emoji)
+        self.ships |= bit
+        self.ship_masks[emoji] = self.ship_masks.get(emoji, 0) | bit
+
+    def hit(self, x: int, y: int) -> None:
+        self.hits |= _bit(x, y) & self.ships
+
     def generate_board(self) -> None:
         for size, emoji in ((4, "🚢"), (3, "⛵"), (2, "🛶")):
             dx, dy = (1, 0) if random.randint(0, 1) else (0, 1)
@@ -63,54 +108,29 @@ class PlayerState:
             x, y = random.choice(positions)
 
             for _ in range(0, size):
-                self.board[x][y].emoji = emoji
+                self.place_ship(x, y, emoji)
                 x += dx
                 y += dy
 
     def can_place_ship(self, x: int, y: int, dx: int, dy: int, size: int) -> bool:
-        bounds = range(0, 5)
-
-        for _ in range(0, size):
-            if x not in bounds or y not in bounds:
-                return False
-
-            cell = self.board[y][x]
-
-            if cell.ship:
-                return False
-
-            x += dx
-            y += dy
-
-        return True
+        mask = _FOOTPRINTS.get((x, y, dx, dy, size))
+        return mask is not None and not mask & self.ships
 
     def get_available_positions(
         self, dx: int, dy: int, size: int
     ) -> list[tuple[int, int]]:
+        ships = self.ships
         return [
             (x, y)
-            for x in range(0, 5)
-            for y in range(0, 5)
-            if self.can_place_ship(x, y, dx, dy, size)
+            for x, y in _STARTS[(dx, dy, size)]
+            if not _FOOTPRINTS[(x, y, dx, dy, size)] & ships
         ]
 
     def is_dead(self) -> bool:
-        for y in range(5):
-            for x in range(5):
-                cell = self.board[y][x]
-
-                if cell.ship and not cell.enemy_state:
-                    return False
-        return True
+        return not self.ships & ~self.hits
 
     def is_ship_shrunk(self, emoji: str) -> bool:
-        for y in range(5):
-            for x in range(5):
-                cell = self.board[y][x]
-
-                if cell.emoji == emoji and not cell.enemy_state:
-                    return False
-        return True
+        return not self.ship_masks.get(emoji, 0) & ~self.hits
 
 
 # Red Button (disabled) -> You hit (bomb_state: True)
@@ -121,15 +141,18 @@ class PlayerState:
 # Boom emoji -> Enemy hit that spot and succeeded (enemy_state: True)
 
 
+_BOMB_STYLES: dict[Optional[bool], discord.ButtonStyle] = {
+    True: discord.ButtonStyle.red,
+    False: discord.ButtonStyle.blurple,
+    None: discord.ButtonStyle.blurple,
+}
+
+
 class Button(discord.ui.Button["BoardView"]):
     def __init__(self, cell: Cell, x: int, y: int) -> None:
         super().__init__(
             label="\u200b",
-            style=(
-                discord.ButtonStyle.red
-                if cell.bomb_state
-                else discord.ButtonStyle.blurple
-            ),
+            style=_BOMB_STYLES[cell.bomb_state],
             disabled=cell.bomb_state is not None,
             emoji=cell.display_emoji,
             row=y,
@@ -141,13 +164,10 @@ class Button(discord.ui.Button["BoardView"]):
         cell.button = self
 
     def update(self) -> None:
-        self.style = (
-            discord.ButtonStyle.red
-            if self.cell.bomb_state
-            else discord.ButtonStyle.blurple
-        )
-        self.disabled = self.cell.bomb_state is not None
-        self.emoji = self.cell.display_emoji
+        cell = self.cell
+        self.style = _BOMB_STYLES[cell.bomb_state]
+        self.disabled = cell.bomb_state is not None
+        self.emoji = cell.display_emoji
 
     async def callback(self, itx: discord.Interaction) -> None:  # type: ignore
         assert self.view is not None, "Un error inesperado ha ocurrido"
@@ -160,7 +180,8 @@ class Button(discord.ui.Button["BoardView"]):
         enemy_cell = enemy.board[self.y][self.x]
 
         self.cell.bomb_state = enemy_cell.ship
-        enemy_cell.enemy_state = enemy_cell.ship
+        enemy_cell.set_enemy(enemy_cell.ship)
+        enemy.hit(self.x, self.y)
 
         self.update()
 
@@ -191,9 +212,9 @@ class Button(discord.ui.Button["BoardView"]):
             content = f"{content}\n\n¡Has hundido su {enemy_cell.emoji}!"
             enemy_content = f"{enemy_content}\n\nTu {enemy_cell.emoji} fue hundido :("
 
-        await itx.response.edit_message(content=content, view=self.view)
+        response = await itx.response.edit_message(content=content, view=self.view)
 
-        self.view.message = await itx.original_response()
+        self.view.message = await _response_message(itx, response)
 
         if enemy_cell.button and enemy_cell.button.view:
             enemy_cell.button.update()
@@ -212,9 +233,11 @@ class BoardView(discord.ui.View):
         self.player: PlayerState = player
         self.enemy: PlayerState = enemy
 
-        for x in range(5):
-            for y in range(5):
-                self.add_item(Button(self.player.board[y][x], x, y))
+        board = self.player.board
+        add_item = self.add_item
+        for i in range(25):
+            y, x = divmod(i, 5)
+            add_item(Button(board[y][x], x, y))
 
     async def interaction_check(self, itx: discord.Interaction) -> bool:  # type: ignore
         if not self.enemy.ready:
@@ -258,6 +281,8 @@ class BoardSetupButton(discord.ui.Button["BoardSetupView"]):
 class BoardSetupView(discord.ui.View):
     children: list[BoardSetupButton]  # type: ignore
 
+    BOATS = {4: "🚢", 3: "⛵", 2: "🛶"}
+
     def __init__(
         self, player: PlayerState, enemy: PlayerState, parent_button: ReadyButton
     ) -> None:
@@ -278,29 +303,21 @@ class BoardSetupView(discord.ui.View):
 
         self.placements: list[tuple[int, int, str]] = []
         self.taken_length: set[int] = set()
+        # Bitboard of the cells already taken by a placement
+        self._occupied: int = 0
 
-        for y in range(5):
-            for x in range(5):
-                self.add_item(BoardSetupButton(x, y))
+        add_item = self.add_item
+        for i in range(25):
+            y, x = divmod(i, 5)
+            add_item(BoardSetupButton(x, y))
 
     def can_place_ship(self, x: int, y: int, dx: int, dy: int, size: int) -> bool:
-        bounds = range(0, 5)
-
-        for _ in range(0, size):
-            if x not in bounds or y not in bounds:
-                return False
-
-            if any(a == x and b == y for a, b, _ in self.placements):
-                return False
-
-            x += dx
-            y += dy
-
-        return True
+        mask = _FOOTPRINTS.get((x, y, dx, dy, size))
+        return mask is not None and not mask & self._occupied
 
     async def commit(self, itx: discord.Interaction) -> None:
         for x, y, emoji in self.placements:
-            self.player.board[y][x].emoji = emoji
+            self.player.place_ship(x, y, emoji)
 
         self.player.ready = True
 
@@ -310,9 +327,9 @@ class BoardSetupView(discord.ui.View):
             f"¡Estás listo! Este es tu tablero, ¡Vas {place}! ¡No borres este mensaje!"
         )
 
-        await itx.response.edit_message(content=content, view=board)
+        response = await itx.response.edit_message(content=content, view=board)
 
-        board.message = await itx.original_response()
+        board.message = await _response_message(itx, response)
         board.parent_message = self.parent_view.message
 
         self.player.view = board
@@ -329,8 +346,7 @@ class BoardSetupView(discord.ui.View):
             content = (
                 f"Juego en progreso entre {self.player.member.mention} y {self.enemy.member.mention}...\n"
                 f"{CHEATSHEET_GUIDE}\n"
-                "Si accidentalmente eliminaste tu tablero, pulsa el botón de abajo para reabrirla. "
-                "Ten en cuenta que esto invalida tu tabla previa."
+                "Si accidentalmente eliminaste tu tablero, pulsa el botón de abajo para reabrirla."
             )
 
         await self.parent_view.message.edit(content=content, view=self.parent_view)
@@ -350,20 +366,12 @@ class BoardSetupView(discord.ui.View):
             if old_x != x and old_y != y:
                 raise RuntimeError("Perdón, no puedes tener piezas diagonales")
 
-            if old_x != x:
-                size = abs(old_x - x) + 1
-                dx, dy = (1, 0)
-                start_x, start_y = min(old_x, x), y
-            elif old_y != y:
-                size = abs(old_y - y) + 1
-                dx, dy = (0, 1)
-                start_x, start_y = x, min(old_y, y)
-            else:
-                raise RuntimeError(
-                    "Perdón, no pude comprender que estabas intentando hacer ahí"
-                )
+            # Exactly one of the axes changed, as the same location cancels the placement
+            dx, dy = int(old_x != x), int(old_y != y)
+            size = abs(old_x - x) + abs(old_y - y) + 1
+            start_x, start_y = min(old_x, x), min(old_y, y)
 
-            boats = {4: "🚢", 3: "⛵", 2: "🛶"}
+            boats = self.BOATS
 
             if size not in boats:
                 raise RuntimeError(
@@ -377,6 +385,7 @@ class BoardSetupView(discord.ui.View):
                 raise RuntimeError("Este barco será bloqueado")
 
             emoji = boats[size]
+            self._occupied |= _FOOTPRINTS[(start_x, start_y, dx, dy, size)]
             for _ in range(size):
                 self.placements.append((start_x, start_y, emoji))
                 button = self.children[start_x + start_y * 5]
@@ -417,15 +426,16 @@ class ReopenBoardButton(discord.ui.Button["Prompt"]):
             view.second if interaction.user.id == view.first.member.id else view.first
         )
 
-        if player.view is not None:
-            player.view.stop()
+        # The buttons of a live board are kept up to date by every hit, so it can be resent as is
+        board = player.view
+        if board is None or board.is_finished():
+            board = BoardView(player, enemy)
 
-        board = BoardView(player, enemy)
-        await interaction.response.send_message(
+        response = await interaction.response.send_message(
             "¡Esta es tu tabla!", view=board, ephemeral=True
         )
         player.view = board
-        board.message = await interaction.original_response()
+        board.message = await _response_message(interaction, response)
         board.parent_message = view.message
 
 
@@ -471,11 +481,9 @@ class Prompt(discord.ui.View):
         self.first: PlayerState = PlayerState(first)
         self.second: PlayerState = PlayerState(second)
 
-        current_player_id = random.choice([first, second]).id
-        if current_player_id == first.id:
-            self.first.current_player = True
-        else:
-            self.second.current_player = True
+        first_goes = random.random() < 0.5
+        self.first.current_player = first_goes
+        self.second.current_player = not first_goes
 
         self.add_item(ReadyButton(self.first, self.second))
         self.add_item(ReadyButton(self.second, self.first))
@@ -20,16 +20,16 @@ class TicTacToeButton(discord.ui.Button["TicTacToeView"]):
 
         view: "TicTacToeView" = self.view
 
-        state = view.board[self.y][self.x]
+        bit = 1 << (self.y * 3 + self.x)
 
-        if state in (view.X, view.O):
+        if (view.x_bits | view.o_bits) & bit:
             return
 
         if view.current_player == view.X:
             self.style = discord.ButtonStyle.danger
             self.label = "X"
             self.disabled = True
-            view.board[self.y][self.x] = view.X
+            view.x_bits |= bit
             view.current_player = view.O
 
             content = f"¡Ahora es el turno de {view.OPlayer.mention}!"
@@ -37,7 +37,7 @@ class TicTacToeButton(discord.ui.Button["TicTacToeView"]):
             self.style = discord.ButtonStyle.success
             self.label = "O"
             self.disabled = True
-            view.board[self.y][self.x] = view.O
+            view.o_bits |= bit
             view.current_player = view.X
 
             content = f"¡Ahora es el turno de {view.XPlayer.mention}!"
@@ -67,6 +67,10 @@ class TicTacToeView(discord.ui.View):
     O = 1
     Tie = 2
 
+    # Rows, columns and diagonals of the board, cell (x, y) being bit y * 3 + x
+    WIN_MASKS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o124, 0o421)
+    FULL_BOARD = 0o777
+
     def __init__(self, xs: discord.Member, os: discord.Member) -> None:
         super().__init__(timeout=None)
 
@@ -75,52 +79,26 @@ class TicTacToeView(discord.ui.View):
         self.XPlayer = xs
         self.OPlayer = os
 
-        self.board = [
-            [0, 0, 0],
-            [0, 0, 0],
-            [0, 0, 0],
-        ]
-
-        for x in range(3):
-            for y in range(3):
-                self.add_item(
-                    TicTacToeButton(
-                        x,
-                        y,
-                        custom_id=f"tictactoe::{self.XPlayer.guild.id}::{self.XPlayer.id}:{self.OPlayer.id}::{x}:{y}",
-                    )
-                )
-
-    def check_board_winner(self):
-        for across in self.board:
-            value = sum(across)
+        self.x_bits: int = 0
+        self.o_bits: int = 0
 
-            if value == 3:
-                return self.O
-            elif value == -3:
-                return self.X
+        prefix = (
+            f"tictactoe::{self.XPlayer.guild.id}::{self.XPlayer.id}:{self.OPlayer.id}::"
+        )
+        for i in range(9):
+            x, y = divmod(i, 3)
+            self.add_item(TicTacToeButton(x, y, custom_id=f"{prefix}{x}:{y}"))
 
-        for line in range(3):
-            value = self.board[0][line] + self.board[1][line] + self.board[2][line]
+    def check_board_winner(self):
+        x_bits, o_bits = self.x_bits, self.o_bits
 
-            if value == 3:
+        for mask in self.WIN_MASKS:
+            if o_bits & mask == mask:
                 return self.O
-            elif value == -3:
+            if x_bits & mask == mask:
                 return self.X
 
-        diag = self.board[0][2] + self.board[1][1] + self.board[2][0]
-        if diag == 3:
-            return self.O
-        elif diag == -3:
-            return self.X
-
-        diag = self.board[0][0] + self.board[1][1] + self.board[2][2]
-        if diag == 3:
-            return self.O
-        elif diag == -3:
-            return self.X
-
-        if all(i != 0 for row in self.board for i in row):
+        if x_bits | o_bits == self.FULL_BOARD:
             return self.Tie
 
         return None
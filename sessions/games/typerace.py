@@ -25,7 +25,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Any, List
+from typing import TYPE_CHECKING, Any, List, Set
 
 import discord
 
@@ -95,7 +95,7 @@ class LFPView(discord.ui.View):
         if not self._still_timeout:
             return
 
-        self.loop.create_task(self.on_timeout, name="timeout view")  # type: ignore
+        self.loop.create_task(self.on_timeout(), name="timeout view")
         self.stop()
 
     @discord.ui.button(
@@ -164,6 +164,7 @@ class TypeRace:
             raise ValueError("One of the players is a bot, please try again")
 
         self.players: List[discord.Member] = players
+        self._ids: Set[int] = {player.id for player in players}
         self._message: discord.Message = message
 
     def __contains__(self, value: Any) -> bool:
@@ -174,7 +175,7 @@ class TypeRace:
 
     def player_exists(self, id: int, /) -> bool:
         """:class:`bool`: Returns ``True`` if the player is currently playing."""
-        return discord.utils.get(self.players, id=id) is not None
+        return id in self._ids
 
     def should_start(self) -> bool:
         """:class:`bool`: Returns whether it is recommended to start the game
@@ -207,6 +208,7 @@ class TypeRace:
             raise ValueError("Member if a bot, and therefore cant't play")
 
         self.players.append(member)
+        self._ids.add(member.id)
 
         return self
 
@@ -221,14 +223,11 @@ class TypeRace:
             The member ID of the player to remove.
         """
 
-        new: List[discord.Member] = []
-
-        for m in self.players:
-            if m.id != id:
-                new.append(m)
+        if id not in self._ids:
+            return
 
-        self.players = new
-        del new
+        self.players = [m for m in self.players if m.id != id]
+        self._ids.discard(id)
 
     async def looking_for_players(self) -> List[discord.Member]:
         """Creates a view that asks for participants.
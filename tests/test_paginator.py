@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("discord.ext.menus")
+pytest.importorskip("jishaku")
+
+from cogs.utils.paginator import TextPageSource  # noqa: E402
+
+
+def test_text_page_source_long_first_line_has_no_empty_page() -> None:
+    source = TextPageSource("a" * 1850, prefix=None, suffix=None)
+
+    assert all(source.entries)
+    assert "".join(source.entries) == "a" * 1850
+    assert all(len(page) <= 1800 for page in source.entries)
+
+
+def test_text_page_source_keeps_short_lines_together() -> None:
+    source = TextPageSource("uno\ndos\ntres")
+
+    assert source.entries == ["```\nuno\ndos\ntres\n```"]
+
+
+def test_text_page_source_drops_blank_pages() -> None:
+    source = TextPageSource("a" * 1799 + "\n\n" + "b" * 1799, prefix=None, suffix=None)
+
+    assert source.entries == ["a" * 1799, "b" * 1799]
+
+
+def test_text_page_source_blank_text_has_one_page() -> None:
+    source = TextPageSource("")
+
+    assert source.entries == ["```\n\n```"]
+
+
+def test_text_page_source_only_splits_on_newlines() -> None:
+    source = TextPageSource("uno\rdos\u2028tres\n", prefix=None, suffix=None)
+
+    assert source.entries == ["uno\rdos\u2028tres\n"]
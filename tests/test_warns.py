@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("discord")
+pytest.importorskip("tortoise")
+pytest.importorskip("discord_tools")
+
+from cogs.warns import MockMember  # noqa: E402
+
+
+class RecordingHTTP:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        async def route(*args, **kwargs) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return route
+
+
+class State:
+    def __init__(self) -> None:
+        self.http = RecordingHTTP()
+
+
+def test_mock_member_kick_uses_kick_route() -> None:
+    state = State()
+    member = MockMember(1, 2, state)  # type: ignore
+
+    asyncio.run(member.kick(reason="Ha llegado a 3 warns"))
+
+    assert state.http.calls == [("kick", (2, 1), {"reason": "Ha llegado a 3 warns"})]